@@ -37,6 +37,7 @@ from generators.base import (
     sanitize_component_name as _sanitize_component_name,
     MAX_CHILDREN_LIMIT,
     MAX_NATIVE_CHILDREN_LIMIT,
+    _to_byte,
 )
 
 
@@ -578,9 +579,9 @@ def _handle_api_error(e: Exception) -> str:
 
 def _rgba_to_hex(color: Dict[str, float]) -> str:
     """Convert Figma RGBA color to hex."""
-    r = int(color.get('r', 0) * 255)
-    g = int(color.get('g', 0) * 255)
-    b = int(color.get('b', 0) * 255)
+    r = _to_byte(color.get('r', 0))
+    g = _to_byte(color.get('g', 0))
+    b = _to_byte(color.get('b', 0))
     a = color.get('a', 1)
 
     if a < 1:
@@ -859,9 +860,9 @@ def _extract_children_summary(children: List[Dict[str, Any]], depth: int = 0, ma
                     if f_type == 'SOLID':
                         color = f.get('color', {})
                         hex_color = '#{:02x}{:02x}{:02x}'.format(
-                            int(color.get('r', 0) * 255),
-                            int(color.get('g', 0) * 255),
-                            int(color.get('b', 0) * 255)
+                            _to_byte(color.get('r', 0)),
+                            _to_byte(color.get('g', 0)),
+                            _to_byte(color.get('b', 0))
                         )
                         fill_summary.append(hex_color)
                     elif 'GRADIENT' in f_type:
@@ -1186,9 +1187,9 @@ def _generate_svg_from_paths(vector_paths: Dict[str, Any], node: Dict[str, Any])
     for fill in fills:
         if fill.get('type') == 'SOLID' and fill.get('visible', True):
             color = fill.get('color', {})
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             fill_color = f'#{r:02x}{g:02x}{b:02x}'
             break
 
@@ -1199,9 +1200,9 @@ def _generate_svg_from_paths(vector_paths: Dict[str, Any], node: Dict[str, Any])
     for stroke in strokes:
         if stroke.get('type') == 'SOLID' and stroke.get('visible', True):
             color = stroke.get('color', {})
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             stroke_color = f'#{r:02x}{g:02x}{b:02x}'
             stroke_width = node.get('strokeWeight', 1)
             break
@@ -1903,9 +1904,9 @@ def _check_accessibility(node: Dict[str, Any], parent_fills: Optional[List] = No
         for fill in fills:
             if fill.get('type') == 'SOLID' and fill.get('visible', True):
                 color = fill.get('color', {})
-                r = int(color.get('r', 0) * 255)
-                g = int(color.get('g', 0) * 255)
-                b = int(color.get('b', 0) * 255)
+                r = _to_byte(color.get('r', 0))
+                g = _to_byte(color.get('g', 0))
+                b = _to_byte(color.get('b', 0))
                 text_rgb = (r, g, b)
 
                 # Calculate contrast against white and black backgrounds
@@ -1978,9 +1979,9 @@ def _gradient_to_css(fill: Dict[str, Any]) -> Optional[str]:
         alpha = color.get('a', 1)
         if alpha < 1:
             # Use rgba for transparency
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             stops_css.append(f"rgba({r}, {g}, {b}, {alpha:.2f}) {int(position * 100)}%")
         else:
             stops_css.append(f"{hex_color} {int(position * 100)}%")
@@ -2461,9 +2462,9 @@ def _get_single_fill_css(fill: Dict[str, Any]) -> Optional[str]:
         hex_color = _rgba_to_hex(color)
 
         if opacity < 1:
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             return f"rgba({r}, {g}, {b}, {opacity:.2f})"
 
         return hex_color
@@ -7,10 +7,14 @@ layout info, typography info - framework-agnostic intermediate representations.
 """
 
 from __future__ import annotations
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union, overload
+import functools
 import math
 import re
+import sys
 
 
 # ---------------------------------------------------------------------------
@@ -191,12 +195,28 @@ TAILWIND_ALIGN_MAP = {
     'RIGHT': 'text-right', 'JUSTIFIED': 'text-justify'
 }
 
+# Shared read-only defaults for dict.get() - never mutate these
+_EMPTY_DICT: Dict[str, Any] = {}
+_ZERO_OFFSET: Dict[str, float] = {'x': 0, 'y': 0}
+
+# Figma gradient paint type → GradientDef.type
+_GRADIENT_TYPES = {
+    'GRADIENT_LINEAR': 'LINEAR', 'GRADIENT_RADIAL': 'RADIAL',
+    'GRADIENT_ANGULAR': 'ANGULAR', 'GRADIENT_DIAMOND': 'DIAMOND',
+}
+
+# Byte → two-digit lowercase hex, used by the color helpers below
+_HEX: Tuple[str, ...] = tuple(f"{i:02x}" for i in range(256))
+
+# ASCII code → hex digit value (0-15), 0xFF for non-hex characters
+_NIB = bytes(int(chr(i), 16) if chr(i) in '0123456789abcdefABCDEF' else 0xFF for i in range(256))
+
 
 # ---------------------------------------------------------------------------
 # Data Structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, repr=False, match_args=False)
 class ColorValue:
     """Framework-agnostic color representation."""
     r: float  # 0-1 range (Figma native)
@@ -206,60 +226,143 @@ class ColorValue:
 
     @property
     def hex(self) -> str:
-        ri, gi, bi = int(self.r * 255), int(self.g * 255), int(self.b * 255)
-        if self.a < 1:
-            ai = int(self.a * 255)
-            return f"#{ri:02x}{gi:02x}{bi:02x}{ai:02x}"
-        return f"#{ri:02x}{gi:02x}{bi:02x}"
+        # Any a < 1 keeps its alpha digits, even when it rounds up to ff
+        rgb = _to_byte(self.r) << 16 | _to_byte(self.g) << 8 | _to_byte(self.b)
+        return _hex_from_int(rgb, _to_byte(self.a) if self.a < 1 else -1)
 
     @property
     def rgba(self) -> str:
-        ri, gi, bi = int(self.r * 255), int(self.g * 255), int(self.b * 255)
+        r, g, b = self.rgb_ints
         if self.a < 1:
-            return f"rgba({ri}, {gi}, {bi}, {self.a:.2f})"
-        return f"rgb({ri}, {gi}, {bi})"
+            return f"rgba({r}, {g}, {b}, {self.a:.2f})"
+        return f"rgb({r}, {g}, {b})"
 
     @property
     def rgb_ints(self) -> Tuple[int, int, int]:
-        return int(self.r * 255), int(self.g * 255), int(self.b * 255)
+        return _to_byte(self.r), _to_byte(self.g), _to_byte(self.b)
 
     @classmethod
     def from_figma(cls, color: Dict[str, float], opacity: float = 1.0) -> 'ColorValue':
-        return cls(
-            r=color.get('r', 0), g=color.get('g', 0), b=color.get('b', 0),
-            a=opacity if opacity < 1 else color.get('a', 1.0)
-        )
+        get = color.get
+        return cls(get('r', 0), get('g', 0), get('b', 0), opacity if opacity < 1 else get('a', 1.0))
 
 
-@dataclass
+@dataclass(slots=True, repr=False, match_args=False)
 class GradientStop:
     """Single gradient color stop."""
     color: ColorValue
     position: float  # 0-1
 
 
-@dataclass
+class GradientStopsArray:
+    """Gradient stops stored as parallel arrays instead of per-stop objects.
+
+    ``rgba`` holds r, g, b, a (0-1) for each stop back to back, ``positions``
+    the matching 0-1 offsets. Indexing/iterating builds detached GradientStop
+    copies on demand, so writes to a returned stop (``stops[0].position = x``)
+    are not reflected here. Iterating is slower than over a plain list; hot
+    loops should use channels(), which yields (r, g, b, a, position) tuples
+    without building GradientStop/ColorValue objects.
+    """
+    __slots__ = ('rgba', 'positions')
+
+    def __init__(self, rgba: Optional[array[float]] = None, positions: Optional[array[float]] = None) -> None:
+        self.rgba: array[float] = rgba if rgba is not None else array('d')
+        self.positions: array[float] = positions if positions is not None else array('d')
+
+    @classmethod
+    def from_figma(cls, stops: Iterable[Dict[str, Any]]) -> 'GradientStopsArray':
+        """Build from Figma 'gradientStops' dicts."""
+        rgba: array[float] = array('d')
+        positions: array[float] = array('d')
+        for s in stops:
+            c = s.get('color', _EMPTY_DICT)
+            get = c.get
+            rgba.extend((get('r', 0), get('g', 0), get('b', 0), get('a', 1)))
+            positions.append(s.get('position', 0))
+        return cls(rgba, positions)
+
+    @classmethod
+    def from_stops(cls, stops: Iterable[GradientStop]) -> 'GradientStopsArray':
+        """Build from GradientStop objects."""
+        rgba: array[float] = array('d')
+        positions: array[float] = array('d')
+        for stop in stops:
+            c = stop.color
+            rgba.extend((c.r, c.g, c.b, c.a))
+            positions.append(stop.position)
+        return cls(rgba, positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @overload
+    def __getitem__(self, i: int) -> GradientStop: ...
+    @overload
+    def __getitem__(self, i: slice) -> 'GradientStopsArray': ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[GradientStop, 'GradientStopsArray']:
+        rgba = self.rgba
+        if isinstance(i, slice):
+            sub: array[float] = array('d')
+            for k in range(*i.indices(len(self.positions))):
+                sub.extend(rgba[k * 4:k * 4 + 4])
+            return GradientStopsArray(sub, self.positions[i])
+        n = len(self.positions)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('gradient stop index out of range')
+        j = i * 4
+        return GradientStop(ColorValue(rgba[j], rgba[j + 1], rgba[j + 2], rgba[j + 3]), self.positions[i])
+
+    def __iter__(self) -> Iterator[GradientStop]:
+        for r, g, b, a, position in self.channels():
+            yield GradientStop(ColorValue(r, g, b, a), position)
+
+    def channels(self) -> Iterator[Tuple[float, float, float, float, float]]:
+        """Yield (r, g, b, a, position) per stop."""
+        rgba = self.rgba
+        for i, position in enumerate(self.positions):
+            j = i * 4
+            yield rgba[j], rgba[j + 1], rgba[j + 2], rgba[j + 3], position
+
+
+@dataclass(slots=True, init=False, eq=False, repr=False, match_args=False)
 class GradientDef:
-    """Framework-agnostic gradient definition."""
-    type: str  # LINEAR, RADIAL, ANGULAR, DIAMOND
-    stops: List[GradientStop]
-    handle_positions: List[Dict[str, float]] = field(default_factory=list)
-    opacity: float = 1.0
+    """Framework-agnostic gradient definition.
 
-    @property
-    def angle_degrees(self) -> float:
-        """Calculate CSS angle from handle positions (for LINEAR)."""
-        if len(self.handle_positions) < 2:
-            return 180.0
-        start = self.handle_positions[0]
-        end = self.handle_positions[1]
-        dx = end.get('x', 1) - start.get('x', 0)
-        dy = end.get('y', 1) - start.get('y', 0)
-        angle = math.degrees(math.atan2(dy, dx))
-        return (90 - angle) % 360
-
-
-@dataclass
+    ``stops`` may also be given as GradientStop objects; they are packed
+    into a GradientStopsArray.
+    """
+    type: str  # LINEAR, RADIAL, ANGULAR, DIAMOND
+    stops: GradientStopsArray
+    handle_positions: List[Dict[str, float]]
+    opacity: float
+    angle_degrees: float  # CSS angle (LINEAR only)
+
+    def __init__(
+        self,
+        type: str,
+        stops: Union[GradientStopsArray, Iterable[GradientStop]],
+        handle_positions: Optional[List[Dict[str, float]]] = None,
+        opacity: float = 1.0,
+    ) -> None:
+        self.type = type
+        self.stops = stops if isinstance(stops, GradientStopsArray) else GradientStopsArray.from_stops(stops)
+        self.handle_positions = handle_positions if handle_positions is not None else []
+        self.opacity = opacity
+        self.angle_degrees = 180.0
+        # Handles never change after parse, so resolve the angle once here
+        if self.type == 'LINEAR' and len(self.handle_positions) >= 2:
+            start = self.handle_positions[0]
+            end = self.handle_positions[1]
+            dx = end.get('x', 1) - start.get('x', 0)
+            dy = end.get('y', 1) - start.get('y', 0)
+            self.angle_degrees = (90 - math.degrees(math.atan2(dy, dx))) % 360
+
+
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class FillLayer:
     """Single fill layer. A node can have multiple fills stacked."""
     type: str  # SOLID, GRADIENT_LINEAR, GRADIENT_RADIAL, GRADIENT_ANGULAR, GRADIENT_DIAMOND, IMAGE
@@ -271,7 +374,7 @@ class FillLayer:
     visible: bool = True
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class StrokeInfo:
     """Framework-agnostic stroke definition."""
     weight: float
@@ -283,7 +386,7 @@ class StrokeInfo:
     individual_weights: Optional[Dict[str, float]] = None  # top, right, bottom, left
 
 
-@dataclass
+@dataclass(slots=True, repr=False, match_args=False)
 class CornerRadii:
     """Corner radius values."""
     top_left: float = 0
@@ -300,7 +403,7 @@ class CornerRadii:
         return self.top_left
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class ShadowEffect:
     """Shadow effect."""
     type: str  # DROP_SHADOW, INNER_SHADOW
@@ -311,14 +414,14 @@ class ShadowEffect:
     spread: float = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class BlurEffect:
     """Blur effect."""
     type: str  # LAYER_BLUR, BACKGROUND_BLUR
     radius: float = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class LayoutInfo:
     """Auto-layout information."""
     mode: str  # VERTICAL, HORIZONTAL, NONE
@@ -334,7 +437,7 @@ class LayoutInfo:
     wrap: str = 'NO_WRAP'  # NO_WRAP, WRAP
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class TextStyle:
     """Typography information."""
     font_family: str = ''
@@ -351,7 +454,7 @@ class TextStyle:
     truncation: str = 'DISABLED'
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class StyleBundle:
     """Complete style information for a node."""
     fills: List[FillLayer] = field(default_factory=list)
@@ -372,19 +475,43 @@ class StyleBundle:
 # Color Conversion Helpers
 # ---------------------------------------------------------------------------
 
+def _to_byte(x: float) -> int:
+    """Quantize a 0-1 channel to 0-255, rounding like Figma and browsers do."""
+    v = int(x * 255 + 0.5)
+    return 0 if v < 0 else 255 if v > 255 else v
+
+
+@functools.lru_cache(maxsize=4096)
+def _hex_from_int(rgb: int, alpha: int = -1) -> str:
+    """Format a packed 0xRRGGBB color as hex, appending alpha when it is >= 0.
+
+    Designs reuse a small palette across many nodes, so results are cached.
+    """
+    h = "#" + _HEX[rgb >> 16] + _HEX[(rgb >> 8) & 0xFF] + _HEX[rgb & 0xFF]
+    if alpha < 0:
+        return h
+    return h + _HEX[alpha]
+
+
 def rgba_to_hex(color: Dict[str, float]) -> str:
     """Convert Figma color dict (r,g,b,a in 0-1) to hex string."""
-    r = int(color.get('r', 0) * 255)
-    g = int(color.get('g', 0) * 255)
-    b = int(color.get('b', 0) * 255)
+    r = _to_byte(color.get('r', 0))
+    g = _to_byte(color.get('g', 0))
+    b = _to_byte(color.get('b', 0))
     a = color.get('a', 1)
     if a < 1:
         return f"rgba({r}, {g}, {b}, {a:.2f})"
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return _hex_from_int(r << 16 | g << 8 | b)
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color string to (R, G, B) tuple (0-255)."""
+    # Fast path: '#RRGGBB' / '#RRGGBBAA' as produced by rgba_to_hex
+    if len(hex_color) in (7, 9) and hex_color[0] == '#' and hex_color.isascii():
+        d = hex_color.encode()
+        r1, r2, g1, g2, b1, b2 = _NIB[d[1]], _NIB[d[2]], _NIB[d[3]], _NIB[d[4]], _NIB[d[5]], _NIB[d[6]]
+        if (r1 | r2 | g1 | g2 | b1 | b2) < 16:
+            return r1 << 4 | r2, g1 << 4 | g2, b1 << 4 | b2
     hex_color = hex_color.strip()
     if hex_color.startswith('rgba'):
         parts = hex_color.replace('rgba(', '').replace(')', '').split(',')
@@ -401,79 +528,106 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
 # Figma Node → Dataclass Parsers
 # ---------------------------------------------------------------------------
 
-def parse_fills(node: Dict[str, Any]) -> List[FillLayer]:
-    """Parse all fills from a Figma node into FillLayer list."""
-    fills = node.get('fills', [])
+def _intern_type(value: Any) -> str:
+    """Intern a paint/effect ``type`` so literal comparisons hit on identity.
+
+    Strings from json.loads are not interned; anything that is not a string
+    (e.g. a JSON null) maps to '' and matches no paint type.
+    """
+    return sys.intern(value) if isinstance(value, str) else ''
+
+
+def _build_gradient(fill: Dict[str, Any]) -> GradientDef:
+    """Build a GradientDef from a Figma gradient paint (fill or stroke)."""
+    return GradientDef(
+        type=_GRADIENT_TYPES[fill['type']],
+        stops=GradientStopsArray.from_figma(fill.get('gradientStops', ())),
+        handle_positions=fill.get('gradientHandlePositions', []),
+        opacity=fill.get('opacity', 1.0)
+    )
+
+
+def _parse_fills_with_primary(
+    node: Dict[str, Any]
+) -> Tuple[List[FillLayer], Optional[ColorValue], Optional[GradientDef]]:
+    """Parse fills and also return the first visible solid color or gradient.
+
+    The primary paint is what TEXT nodes use as their text color, so text
+    parsing can reuse this single pass instead of walking the fills again.
+    """
+    fills = node.get('fills', ())
     result = []
+    primary_color = None
+    primary_gradient = None
+    has_primary = False
     for fill in fills:
-        visible = fill.get('visible', True)
-        if not visible:
+        get = fill.get
+        if not get('visible', True):
             continue
-        fill_type = fill.get('type', '')
-        layer = FillLayer(type=fill_type, visible=visible, opacity=fill.get('opacity', 1.0))
+        fill_type = _intern_type(get('type'))
+        opacity = get('opacity', 1.0)
+        # Positional in field order: type, color, gradient, image_ref, scale_mode, opacity, visible
+        layer = FillLayer(fill_type, None, None, None, 'FILL', opacity, True)
 
         if fill_type == 'SOLID':
-            color_data = fill.get('color', {})
-            layer.color = ColorValue.from_figma(color_data, fill.get('opacity', 1.0))
-
-        elif 'GRADIENT' in fill_type:
-            stops = []
-            for s in fill.get('gradientStops', []):
-                c = s.get('color', {})
-                stops.append(GradientStop(
-                    color=ColorValue(r=c.get('r', 0), g=c.get('g', 0), b=c.get('b', 0), a=c.get('a', 1)),
-                    position=s.get('position', 0)
-                ))
-            gradient_type = fill_type.replace('GRADIENT_', '')
-            layer.gradient = GradientDef(
-                type=gradient_type,
-                stops=stops,
-                handle_positions=fill.get('gradientHandlePositions', []),
-                opacity=fill.get('opacity', 1.0)
-            )
+            layer.color = ColorValue.from_figma(get('color', _EMPTY_DICT), opacity)
+
+        elif fill_type in _GRADIENT_TYPES:
+            layer.gradient = _build_gradient(fill)
 
         elif fill_type == 'IMAGE':
-            layer.image_ref = fill.get('imageRef', '')
-            layer.scale_mode = fill.get('scaleMode', 'FILL')
+            layer.image_ref = get('imageRef', '')
+            layer.scale_mode = get('scaleMode', 'FILL')
 
+        if not has_primary and (layer.color is not None or layer.gradient is not None):
+            primary_color, primary_gradient = layer.color, layer.gradient
+            has_primary = True
         result.append(layer)
-    return result
+    return result, primary_color, primary_gradient
+
+
+def _primary_paint(node: Dict[str, Any]) -> Tuple[Optional[ColorValue], Optional[GradientDef]]:
+    """Return only the first visible solid color or gradient, stopping there."""
+    for fill in node.get('fills', ()):
+        get = fill.get
+        if not get('visible', True):
+            continue
+        fill_type = get('type')
+        if fill_type == 'SOLID':
+            return ColorValue.from_figma(get('color', _EMPTY_DICT), get('opacity', 1.0)), None
+        if fill_type in _GRADIENT_TYPES:
+            return None, _build_gradient(fill)
+    return None, None
+
+
+def parse_fills(node: Dict[str, Any]) -> List[FillLayer]:
+    """Parse all fills from a Figma node into FillLayer list."""
+    return _parse_fills_with_primary(node)[0]
 
 
 def parse_stroke(node: Dict[str, Any]) -> Optional[StrokeInfo]:
     """Parse stroke from a Figma node."""
-    strokes = node.get('strokes', [])
+    strokes = node.get('strokes', ())
     weight = node.get('strokeWeight', 0)
     if not strokes or weight == 0:
         return None
 
     colors = []
-    stroke_item_dashes = []
+    stroke_item_dashes: List[float] = []
     for s in strokes:
         if not s.get('visible', True):
             continue
-        s_type = s.get('type', '')
-        layer = FillLayer(type=s_type, visible=True, opacity=s.get('opacity', 1.0))
+        s_type = _intern_type(s.get('type'))
+        # Positional in FillLayer field order, see _parse_fills_with_primary
+        layer = FillLayer(s_type, None, None, None, 'FILL', s.get('opacity', 1.0), True)
         # Collect dashes from individual stroke items as fallback
         item_dashes = s.get('strokeDashes', []) or s.get('dashPattern', []) or s.get('dashes', [])
         if item_dashes and not stroke_item_dashes:
             stroke_item_dashes = item_dashes
         if s_type == 'SOLID':
-            layer.color = ColorValue.from_figma(s.get('color', {}), s.get('opacity', 1.0))
-        elif 'GRADIENT' in s_type:
-            stops = []
-            for gs in s.get('gradientStops', []):
-                c = gs.get('color', {})
-                stops.append(GradientStop(
-                    color=ColorValue(r=c.get('r', 0), g=c.get('g', 0), b=c.get('b', 0), a=c.get('a', 1)),
-                    position=gs.get('position', 0)
-                ))
-            layer.gradient = GradientDef(
-                type=s_type.replace('GRADIENT_', ''),
-                stops=stops,
-                handle_positions=s.get('gradientHandlePositions', []),
-                opacity=s.get('opacity', 1.0)
-            )
+            layer.color = ColorValue.from_figma(s.get('color', _EMPTY_DICT), s.get('opacity', 1.0))
+        elif s_type in _GRADIENT_TYPES:
+            layer.gradient = _build_gradient(s)
         colors.append(layer)
 
     if not colors:
@@ -500,87 +654,75 @@ def parse_corners(node: Dict[str, Any]) -> Optional[CornerRadii]:
     """Parse corner radii from a Figma node."""
     radii = node.get('rectangleCornerRadii')
     if radii and len(radii) == 4:
-        return CornerRadii(top_left=radii[0], top_right=radii[1],
-                          bottom_right=radii[2], bottom_left=radii[3])
+        return CornerRadii(radii[0], radii[1], radii[2], radii[3])
     cr = node.get('cornerRadius', 0)
     if cr > 0:
-        return CornerRadii(top_left=cr, top_right=cr, bottom_right=cr, bottom_left=cr)
+        return CornerRadii(cr, cr, cr, cr)
     return None
 
 
 def parse_effects(node: Dict[str, Any]) -> Tuple[List[ShadowEffect], List[BlurEffect]]:
     """Parse effects (shadows + blurs) from a Figma node."""
-    effects = node.get('effects', [])
+    effects = node.get('effects', ())
     shadows = []
     blurs = []
     for e in effects:
-        if not e.get('visible', True):
+        get = e.get
+        if not get('visible', True):
             continue
-        e_type = e.get('type', '')
+        e_type = _intern_type(get('type'))
         if e_type in ('DROP_SHADOW', 'INNER_SHADOW'):
-            color = e.get('color', {})
-            offset = e.get('offset', {'x': 0, 'y': 0})
+            cget = get('color', _EMPTY_DICT).get
+            offset = get('offset', _ZERO_OFFSET)
             shadows.append(ShadowEffect(
-                type=e_type,
-                color=ColorValue(r=color.get('r', 0), g=color.get('g', 0),
-                                b=color.get('b', 0), a=color.get('a', 0.25)),
-                offset_x=offset.get('x', 0), offset_y=offset.get('y', 0),
-                radius=e.get('radius', 0), spread=e.get('spread', 0)
+                e_type,
+                ColorValue(cget('r', 0), cget('g', 0), cget('b', 0), cget('a', 0.25)),
+                offset.get('x', 0), offset.get('y', 0),
+                get('radius', 0), get('spread', 0)
             ))
         elif e_type in ('LAYER_BLUR', 'BACKGROUND_BLUR'):
-            blurs.append(BlurEffect(type=e_type, radius=e.get('radius', 0)))
+            blurs.append(BlurEffect(e_type, get('radius', 0)))
     return shadows, blurs
 
 
 def parse_layout(node: Dict[str, Any]) -> Optional[LayoutInfo]:
     """Parse auto-layout from a Figma node."""
-    mode = node.get('layoutMode')
+    get = node.get
+    mode = get('layoutMode')
     if not mode or mode == 'NONE':
         return None
+    # Positional, in LayoutInfo field order
     return LayoutInfo(
-        mode=mode,
-        gap=node.get('itemSpacing', 0),
-        padding_top=node.get('paddingTop', 0),
-        padding_right=node.get('paddingRight', 0),
-        padding_bottom=node.get('paddingBottom', 0),
-        padding_left=node.get('paddingLeft', 0),
-        primary_align=node.get('primaryAxisAlignItems', 'MIN'),
-        counter_align=node.get('counterAxisAlignItems', 'MIN'),
-        primary_sizing=node.get('primaryAxisSizingMode', 'AUTO'),
-        counter_sizing=node.get('counterAxisSizingMode', 'AUTO'),
-        wrap=node.get('layoutWrap', 'NO_WRAP')
+        mode,
+        get('itemSpacing', 0),
+        get('paddingTop', 0),
+        get('paddingRight', 0),
+        get('paddingBottom', 0),
+        get('paddingLeft', 0),
+        get('primaryAxisAlignItems', 'MIN'),
+        get('counterAxisAlignItems', 'MIN'),
+        get('primaryAxisSizingMode', 'AUTO'),
+        get('counterAxisSizingMode', 'AUTO'),
+        get('layoutWrap', 'NO_WRAP')
     )
 
 
-def parse_text_style(node: Dict[str, Any]) -> TextStyle:
-    """Parse text styling from a TEXT node."""
-    style = node.get('style', {})
-    fills = node.get('fills', [])
+def parse_text_style(
+    node: Dict[str, Any],
+    primary: Optional[Tuple[Optional[ColorValue], Optional[GradientDef]]] = None
+) -> TextStyle:
+    """Parse text styling from a TEXT node.
 
-    # Text color: check for solid or gradient
-    text_color = None
-    text_gradient = None
-    for fill in fills:
-        if not fill.get('visible', True):
-            continue
-        if fill.get('type') == 'SOLID':
-            text_color = ColorValue.from_figma(fill.get('color', {}), fill.get('opacity', 1.0))
-            break
-        elif 'GRADIENT' in fill.get('type', ''):
-            stops = []
-            for s in fill.get('gradientStops', []):
-                c = s.get('color', {})
-                stops.append(GradientStop(
-                    color=ColorValue(r=c.get('r', 0), g=c.get('g', 0), b=c.get('b', 0), a=c.get('a', 1)),
-                    position=s.get('position', 0)
-                ))
-            text_gradient = GradientDef(
-                type=fill['type'].replace('GRADIENT_', ''),
-                stops=stops,
-                handle_positions=fill.get('gradientHandlePositions', []),
-                opacity=fill.get('opacity', 1.0)
-            )
-            break
+    Pass ``primary`` as the (color, gradient) pair from
+    _parse_fills_with_primary() when the node's fills were already parsed.
+    """
+    style = node.get('style', _EMPTY_DICT)
+
+    # Text color: first visible solid or gradient fill
+    if primary is None:
+        text_color, text_gradient = _primary_paint(node)
+    else:
+        text_color, text_gradient = primary
 
     return TextStyle(
         font_family=style.get('fontFamily', ''),
@@ -598,25 +740,94 @@ def parse_text_style(node: Dict[str, Any]) -> TextStyle:
     )
 
 
-def parse_style_bundle(node: Dict[str, Any]) -> StyleBundle:
-    """Parse complete style information from a Figma node."""
-    bbox = node.get('absoluteBoundingBox', {})
-    shadows, blurs = parse_effects(node)
-
-    return StyleBundle(
-        fills=parse_fills(node),
-        stroke=parse_stroke(node),
-        corners=parse_corners(node),
-        shadows=shadows,
-        blurs=blurs,
-        opacity=node.get('opacity', 1.0),
-        blend_mode=node.get('blendMode', 'PASS_THROUGH'),
-        rotation=node.get('rotation', 0),
-        layout=parse_layout(node),
-        width=bbox.get('width', 0),
-        height=bbox.get('height', 0),
-        clips_content=node.get('clipsContent', False)
-    )
+_POOL_MAX = 4096
+
+
+class StyleBundlePool:
+    """Hands out recycled StyleBundles; see bundle_pool().
+
+    Each pool keeps its own free list and takes no locks, so use one pool
+    per thread.
+    """
+
+    def __init__(self) -> None:
+        self._live: List[StyleBundle] = []
+        self._free: List[StyleBundle] = []
+
+    def get_or_new(self) -> StyleBundle:
+        """Return a free bundle (fields stale, caller overwrites) or a new one."""
+        sb = self._free.pop() if self._free else StyleBundle()
+        self._live.append(sb)
+        return sb
+
+    def release(self, mark: int = 0) -> None:
+        """Return bundles handed out after the first ``mark`` to the free list."""
+        live = self._live
+        self._free.extend(live[mark:])
+        del self._free[_POOL_MAX:]
+        del live[mark:]
+
+
+@contextmanager
+def bundle_pool(pool: Optional[StyleBundlePool] = None) -> Iterator[StyleBundlePool]:
+    """Scope for recycling StyleBundles across a tree traversal.
+
+    Bundles parsed with the yielded pool are reused once the block exits,
+    so they must not be kept past it. Pass the same pool to later or nested
+    scopes to keep recycling its bundles; a nested scope only releases the
+    bundles handed out inside it.
+    """
+    if pool is None:
+        pool = StyleBundlePool()
+    mark = len(pool._live)
+    try:
+        yield pool
+    finally:
+        pool.release(mark)
+
+
+def parse_style_bundle(node: Dict[str, Any], pool: Optional[StyleBundlePool] = None) -> StyleBundle:
+    """Parse complete style information from a Figma node.
+
+    Pass a pool from bundle_pool() to reuse bundles instead of allocating.
+    """
+    bbox = node.get('absoluteBoundingBox', _EMPTY_DICT)
+    # Most nodes are sparse - only run the sub-parsers whose keys are present
+    if 'effects' in node:
+        shadows, blurs = parse_effects(node)
+    else:
+        shadows, blurs = [], []
+    has_corners = 'cornerRadius' in node or 'rectangleCornerRadii' in node
+
+    fills = parse_fills(node) if 'fills' in node else []
+    stroke = parse_stroke(node) if 'strokes' in node else None
+    corners = parse_corners(node) if has_corners else None
+    opacity = node.get('opacity', 1.0)
+    blend_mode = node.get('blendMode', 'PASS_THROUGH')
+    rotation = node.get('rotation', 0)
+    layout = parse_layout(node) if 'layoutMode' in node else None
+    width = bbox.get('width', 0)
+    height = bbox.get('height', 0)
+    clips_content = node.get('clipsContent', False)
+
+    if pool is None:
+        return StyleBundle(fills, stroke, corners, shadows, blurs, opacity, blend_mode,
+                           rotation, layout, width, height, clips_content)
+
+    sb = pool.get_or_new()
+    sb.fills = fills
+    sb.stroke = stroke
+    sb.corners = corners
+    sb.shadows = shadows
+    sb.blurs = blurs
+    sb.opacity = opacity
+    sb.blend_mode = blend_mode
+    sb.rotation = rotation
+    sb.layout = layout
+    sb.width = width
+    sb.height = height
+    sb.clips_content = clips_content
+    return sb
 
 
 # ---------------------------------------------------------------------------
@@ -694,7 +905,7 @@ def _extract_gradient_stops(gradient_stops: List[Dict[str, Any]]) -> List[Dict[s
     """Extract gradient color stops."""
     stops = []
     for stop in gradient_stops:
-        color = stop.get('color', {})
+        color = stop.get('color', _EMPTY_DICT)
         stops.append({
             'position': round(stop.get('position', 0), 4),
             'color': rgba_to_hex(color),
@@ -705,7 +916,7 @@ def _extract_gradient_stops(gradient_stops: List[Dict[str, Any]]) -> List[Dict[s
 
 def _extract_stroke_data(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extract comprehensive stroke data."""
-    strokes = node.get('strokes', [])
+    strokes = node.get('strokes', ())
     if not strokes:
         return None
 
@@ -719,7 +930,7 @@ def _extract_stroke_data(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 'blendMode': stroke.get('blendMode', 'NORMAL')
             }
             if stroke_type == 'SOLID':
-                hex_color = rgba_to_hex(stroke.get('color', {}))
+                hex_color = rgba_to_hex(stroke.get('color', _EMPTY_DICT))
                 stroke_data['hex'] = hex_color
                 stroke_data['color'] = hex_color
                 rgb = hex_to_rgb(hex_color)
@@ -761,7 +972,7 @@ def _extract_stroke_data(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 def _extract_effects_data(node: Dict[str, Any]) -> Dict[str, Any]:
     """Extract all effects (shadows, blurs) from a node."""
-    effects = node.get('effects', [])
+    effects = node.get('effects', ())
     shadows = []
     blurs = []
 
@@ -770,8 +981,8 @@ def _extract_effects_data(node: Dict[str, Any]) -> Dict[str, Any]:
             continue
         effect_type = effect.get('type', '')
         if effect_type in ['DROP_SHADOW', 'INNER_SHADOW']:
-            color = effect.get('color', {})
-            offset = effect.get('offset', {'x': 0, 'y': 0})
+            color = effect.get('color', _EMPTY_DICT)
+            offset = effect.get('offset', _ZERO_OFFSET)
             hex_color = rgba_to_hex(color)
             rgb = hex_to_rgb(hex_color)
             hsl = _rgb_to_hsl(*rgb)
@@ -811,22 +1022,14 @@ def _gradient_to_css(fill: Dict[str, Any]) -> Optional[str]:
     fill_type = fill.get('type', '')
     if 'GRADIENT' not in fill_type:
         return None
-    gradient_stops = fill.get('gradientStops', [])
+    gradient_stops = fill.get('gradientStops', ())
     if not gradient_stops:
         return None
     stops_css = []
     for stop in gradient_stops:
-        color = stop.get('color', {})
-        position = stop.get('position', 0)
-        hex_color = rgba_to_hex(color)
-        alpha = color.get('a', 1)
-        if alpha < 1:
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
-            stops_css.append(f"rgba({r}, {g}, {b}, {alpha:.2f}) {int(position * 100)}%")
-        else:
-            stops_css.append(f"{hex_color} {int(position * 100)}%")
+        # rgba_to_hex already yields rgba() for translucent stops
+        color_css = rgba_to_hex(stop.get('color', _EMPTY_DICT))
+        stops_css.append(f"{color_css} {int(stop.get('position', 0) * 100)}%")
     stops_str = ', '.join(stops_css)
     if fill_type == 'GRADIENT_LINEAR':
         handle_positions = fill.get('gradientHandlePositions', [])
@@ -847,13 +1050,13 @@ def _get_single_fill_css(fill: Dict[str, Any]) -> Optional[str]:
         return None
     fill_type = fill.get('type', '')
     if fill_type == 'SOLID':
-        color = fill.get('color', {})
+        color = fill.get('color', _EMPTY_DICT)
         opacity = fill.get('opacity', 1)
         hex_color = rgba_to_hex(color)
         if opacity < 1:
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             return f"rgba({r}, {g}, {b}, {opacity:.2f})"
         return hex_color
     elif 'GRADIENT' in fill_type:
@@ -880,7 +1083,7 @@ def _get_background_css(node: Dict[str, Any]) -> tuple:
     Returns:
         tuple: (background_value, background_type)
     """
-    fills = node.get('fills', [])
+    fills = node.get('fills', ())
     if not fills:
         return None, None
     css_values = []
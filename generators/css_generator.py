@@ -23,6 +23,7 @@ from generators.base import (
     _sanitize_token_name,
     _extract_gradient_stops,
     _rgba_to_hex,
+    _to_byte,
 )
 
 
@@ -497,9 +498,9 @@ def generate_scss_code(node: Dict[str, Any], component_name: str) -> str:
             offset_y = effect.get('offset', {}).get('y', 0)
             blur = effect.get('radius', 0)
             spread = effect.get('spread', 0)
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             a = color.get('a', 1)
             inset = 'inset ' if effect_type == 'INNER_SHADOW' else ''
             shadow_parts.append(f'{inset}{offset_x}px {offset_y}px {blur}px {spread}px rgba({r}, {g}, {b}, {a:.2f})')
@@ -13,6 +13,7 @@ from typing import Dict, Any, List
 from generators.base import (
     KOTLIN_WEIGHT_MAP,
     MAX_NATIVE_CHILDREN_LIMIT,
+    _to_byte,
 )
 
 
@@ -39,11 +40,11 @@ def generate_kotlin_code(node: Dict[str, Any], component_name: str) -> str:
 
         if fill_type == 'SOLID':
             color = fill.get('color', {})
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             a = fill.get('opacity', color.get('a', 1))
-            bg_code = f".background(Color(0x{int(a*255):02X}{r:02X}{g:02X}{b:02X}))"
+            bg_code = f".background(Color(0x{_to_byte(a):02X}{r:02X}{g:02X}{b:02X}))"
             break
 
         elif fill_type == 'GRADIENT_LINEAR':
@@ -53,9 +54,9 @@ def generate_kotlin_code(node: Dict[str, Any], component_name: str) -> str:
                 colors = []
                 for stop in stops:
                     c = stop.get('color', {})
-                    sr = int(c.get('r', 0) * 255)
-                    sg = int(c.get('g', 0) * 255)
-                    sb = int(c.get('b', 0) * 255)
+                    sr = _to_byte(c.get('r', 0))
+                    sg = _to_byte(c.get('g', 0))
+                    sb = _to_byte(c.get('b', 0))
                     colors.append(f"Color(0xFF{sr:02X}{sg:02X}{sb:02X})")
                 brush_def = f'''    val gradientBrush = Brush.horizontalGradient(
         colors = listOf({", ".join(colors)})
@@ -71,9 +72,9 @@ def generate_kotlin_code(node: Dict[str, Any], component_name: str) -> str:
                 colors = []
                 for stop in stops:
                     c = stop.get('color', {})
-                    sr = int(c.get('r', 0) * 255)
-                    sg = int(c.get('g', 0) * 255)
-                    sb = int(c.get('b', 0) * 255)
+                    sr = _to_byte(c.get('r', 0))
+                    sg = _to_byte(c.get('g', 0))
+                    sb = _to_byte(c.get('b', 0))
                     colors.append(f"Color(0xFF{sr:02X}{sg:02X}{sb:02X})")
                 brush_def = f'''    val gradientBrush = Brush.radialGradient(
         colors = listOf({", ".join(colors)})
@@ -135,9 +136,9 @@ def generate_kotlin_code(node: Dict[str, Any], component_name: str) -> str:
             offset_x = effect.get('offset', {}).get('x', 0)
             offset_y = effect.get('offset', {}).get('y', 0)
             blur = effect.get('radius', 0)
-            r = int(color.get('r', 0) * 255)
-            g = int(color.get('g', 0) * 255)
-            b = int(color.get('b', 0) * 255)
+            r = _to_byte(color.get('r', 0))
+            g = _to_byte(color.get('g', 0))
+            b = _to_byte(color.get('b', 0))
             a = color.get('a', 0.25)
             shadow_import = 'import androidx.compose.ui.draw.shadow'
             shadow_code = f'.shadow(elevation = {blur}.dp, shape = RoundedCornerShape({corner_radius}.dp))'
@@ -332,9 +333,9 @@ def generate_kotlin_children(children: List[Dict[str, Any]], indent: int = 8) ->
             bg = ''
             if fills and fills[0].get('type') == 'SOLID':
                 color = fills[0].get('color', {})
-                r = int(color.get('r', 0) * 255)
-                g = int(color.get('g', 0) * 255)
-                b = int(color.get('b', 0) * 255)
+                r = _to_byte(color.get('r', 0))
+                g = _to_byte(color.get('g', 0))
+                b = _to_byte(color.get('b', 0))
                 bg = f".background(Color(0xFF{r:02X}{g:02X}{b:02X}))"
 
             lines.append(f'{prefix}// {name}')
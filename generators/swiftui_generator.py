@@ -125,12 +125,11 @@ def _gradient_to_swiftui(gradient: GradientDef, node_width: float = 0, node_heig
     Returns (gradient_code, gradient_variable_definition).
     """
     stops_code = []
-    for stop in gradient.stops:
-        c = stop.color
-        color = f"Color(red: {c.r:.3f}, green: {c.g:.3f}, blue: {c.b:.3f})"
-        if c.a < 1:
-            color += f".opacity({c.a:.2f})"
-        stops_code.append(f".init(color: {color}, location: {stop.position:.4f})")
+    for r, g, b, a, position in gradient.stops.channels():
+        color = f"Color(red: {r:.3f}, green: {g:.3f}, blue: {b:.3f})"
+        if a < 1:
+            color += f".opacity({a:.2f})"
+        stops_code.append(f".init(color: {color}, location: {position:.4f})")
 
     stops_str = ', '.join(stops_code)
 
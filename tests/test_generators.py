@@ -1,9 +1,15 @@
 """Tests for code generator fixes."""
-from generators.base import MAX_CHILDREN_LIMIT, MAX_NATIVE_CHILDREN_LIMIT, parse_fills, ColorValue, GradientStop, GradientDef, ICON_NAME_MAP
+from generators.base import (
+    MAX_CHILDREN_LIMIT, MAX_NATIVE_CHILDREN_LIMIT, parse_fills, ColorValue, GradientStop, GradientDef, ICON_NAME_MAP,
+    hex_to_rgb, rgba_to_hex, parse_style_bundle, bundle_pool, StyleBundlePool,
+    parse_text_style, _parse_fills_with_primary,
+)
 from generators.react_generator import generate_react_code
 from generators.css_generator import generate_css_code
 import math
 
+import pytest
+
 
 class TestChildLimitsConsistency:
     """Verify child limits are consistent across modules."""
@@ -200,6 +206,34 @@ class TestRadialGradientRadius:
         assert 'endRadius: 200' in code
 
 
+class TestGradientStopsArray:
+    """Verify SoA gradient stops behave like the old list of GradientStop."""
+
+    def test_parsed_stops(self, node_with_radial_gradient):
+        stops = parse_fills(node_with_radial_gradient)[0].gradient.stops
+        assert len(stops) == 2
+        assert stops[0].color.hex == '#ff0000'
+        assert stops[-1].position == 1
+        assert [s.color.hex for s in stops] == ['#ff0000', '#0000ff']
+        assert list(stops.channels())[1] == (0, 0, 1, 1, 1)
+
+    def test_list_input_is_converted(self):
+        gradient = GradientDef(type='LINEAR', stops=[GradientStop(color=ColorValue(r=0, g=1, b=0, a=0.5), position=0.25)])
+        stop = gradient.stops[0]
+        assert (stop.color.g, stop.color.a, stop.position) == (1, 0.5, 0.25)
+
+    def test_index_out_of_range(self, node_with_radial_gradient):
+        stops = parse_fills(node_with_radial_gradient)[0].gradient.stops
+        for i in (2, -3):
+            with pytest.raises(IndexError):
+                stops[i]
+
+    def test_slice(self, node_with_radial_gradient):
+        stops = parse_fills(node_with_radial_gradient)[0].gradient.stops
+        assert [s.color.hex for s in stops[1:]] == ['#0000ff']
+        assert [s.position for s in stops[::-1]] == [1, 0]
+
+
 class TestIconNameMapNoDuplicates:
     """Verify no duplicate keys in ICON_NAME_MAP."""
 
@@ -224,6 +258,23 @@ class TestColorValueHex:
         assert result.startswith('#'), f"hex should return # prefix, got: {result}"
         assert 'rgba' not in result, f"hex should not return rgba(), got: {result}"
 
+    def test_channels_round_to_nearest(self):
+        """0.5 * 255 = 127.5 should round to 128 (0x80), not truncate to 127."""
+        c = ColorValue(r=0.5, g=0.5, b=0.5, a=0.5)
+        assert c.hex == '#80808080'
+        assert c.rgb_ints == (128, 128, 128)
+        assert rgba_to_hex({'r': 0.5, 'g': 0.5, 'b': 0.5}) == '#808080'
+
+    def test_hex_follows_channel_updates(self):
+        c = ColorValue(r=1.0, g=0.0, b=0.0)
+        c.r = 0.0
+        assert c.hex == '#000000'
+        assert c.rgb_ints == (0, 0, 0)
+
+    def test_near_opaque_alpha_is_kept(self):
+        """a=0.999 rounds to 0xff but is still translucent, so keep the alpha digits."""
+        assert ColorValue(r=1.0, g=0.0, b=0.0, a=0.999).hex == '#ff0000ff'
+
     def test_transparent_color_rgba_property(self):
         """rgba property should return rgba() string."""
         c = ColorValue(r=1.0, g=0.0, b=0.0, a=0.5)
@@ -231,6 +282,112 @@ class TestColorValueHex:
         assert result.startswith('rgba('), f"rgba should return rgba() string, got: {result}"
 
 
+class TestValueEquality:
+    """Color and stop value types compare by value."""
+
+    def test_color_and_stop_equality(self):
+        assert ColorValue(1.0, 0.5, 0.0) == ColorValue(1.0, 0.5, 0.0)
+        assert ColorValue(1.0, 0.5, 0.0) != ColorValue(1.0, 0.5, 0.0, 0.5)
+        assert GradientStop(ColorValue(0, 0, 0), 0.5) == GradientStop(ColorValue(0, 0, 0), 0.5)
+
+
+class TestHexToRgb:
+    """Verify hex_to_rgb handles every color string format."""
+
+    def test_six_digit_hex(self):
+        assert hex_to_rgb('#ff8000') == (255, 128, 0)
+        assert hex_to_rgb('#FF8000') == (255, 128, 0)
+
+    def test_eight_digit_hex_ignores_alpha(self):
+        assert hex_to_rgb('#0a141e80') == (10, 20, 30)
+
+    def test_shorthand_and_unprefixed(self):
+        assert hex_to_rgb('#f80') == (255, 136, 0)
+        assert hex_to_rgb(' ff8000 ') == (255, 128, 0)
+
+    def test_rgba_string(self):
+        assert hex_to_rgb('rgba(10, 20, 30, 0.50)') == (10, 20, 30)
+
+
+class TestBundlePool:
+    """Verify pooled StyleBundles are recycled and fully overwritten."""
+
+    def test_bundle_reused_after_scope(self, node_with_inner_shadow, node_with_background_blur):
+        pool = StyleBundlePool()
+        with bundle_pool(pool):
+            first = parse_style_bundle(node_with_inner_shadow, pool)
+            assert len(first.shadows) == 1
+        with bundle_pool(pool):
+            second = parse_style_bundle(node_with_background_blur, pool)
+        assert second is first
+        assert second.shadows == []
+        assert len(second.blurs) == 1
+        assert second.width == 200
+
+    def test_nested_scope_keeps_outer_bundles(self, node_with_inner_shadow, node_with_background_blur):
+        pool = StyleBundlePool()
+        with bundle_pool(pool):
+            parent = parse_style_bundle({**node_with_inner_shadow, 'opacity': 0.5}, pool)
+            with bundle_pool(pool):
+                child = parse_style_bundle(node_with_background_blur, pool)
+            first = parse_style_bundle({**node_with_background_blur, 'opacity': 0.2}, pool)
+            second = parse_style_bundle({**node_with_background_blur, 'opacity': 0.2}, pool)
+            assert first is child
+            assert second is not parent
+            assert parent.opacity == 0.5
+            assert len(parent.shadows) == 1
+
+    def test_pools_do_not_share_bundles(self, node_with_inner_shadow):
+        with bundle_pool() as pool:
+            first = parse_style_bundle(node_with_inner_shadow, pool)
+        with bundle_pool() as pool:
+            assert parse_style_bundle(node_with_inner_shadow, pool) is not first
+
+    def test_unpooled_matches_pooled(self, node_with_dashed_stroke):
+        plain = parse_style_bundle(node_with_dashed_stroke)
+        with bundle_pool() as pool:
+            pooled = parse_style_bundle(node_with_dashed_stroke, pool)
+            assert pooled.fills[0].color.hex == plain.fills[0].color.hex
+            assert pooled.stroke.dashes == plain.stroke.dashes
+            assert (pooled.width, pooled.height) == (plain.width, plain.height)
+
+
+class TestTextStylePrimaryPaint:
+    """Verify text color comes from the first visible solid/gradient fill."""
+
+    NODE = {
+        'type': 'TEXT',
+        'style': {'fontSize': 14},
+        'fills': [
+            {'type': 'IMAGE', 'imageRef': 'abc'},
+            {'type': 'SOLID', 'visible': False, 'color': {'r': 1, 'g': 0, 'b': 0}},
+            {'type': 'SOLID', 'color': {'r': 0, 'g': 0, 'b': 1}, 'opacity': 0.5},
+            {'type': 'GRADIENT_LINEAR', 'gradientStops': []},
+        ],
+    }
+
+    def test_without_primary(self):
+        ts = parse_text_style(self.NODE)
+        assert ts.color.hex == '#0000ff80'
+        assert ts.gradient is None
+
+    def test_with_primary_from_fill_pass(self):
+        fills, color, gradient = _parse_fills_with_primary(self.NODE)
+        assert len(fills) == 3
+        ts = parse_text_style(self.NODE, primary=(color, gradient))
+        assert ts.color is color
+        assert ts.gradient is None
+        assert ts.font_size == 14
+
+
+class TestNullPaintType:
+    """A JSON null paint type must not break the parsers."""
+
+    def test_null_fill_type(self):
+        fills = parse_fills({'fills': [{'type': None}, {'type': 'SOLID', 'color': {'r': 1, 'g': 0, 'b': 0}}]})
+        assert [f.type for f in fills] == ['', 'SOLID']
+
+
 class TestHardcodedPi:
     """Verify math.pi is used instead of hardcoded value."""
 